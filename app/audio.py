@@ -0,0 +1,125 @@
+import struct
+import wave
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional, Union
+
+import numpy as np
+import soundfile as sf
+
+from app.config import STORAGE_DIR, SAVED_AUDIO_DIR, CLONED_VOICES_DIR
+
+WAV_WRITE_BUFSIZE = 1 << 20
+
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def wav_header(data_bytes: int, sampling_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+    block_align = channels * sample_width
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sampling_rate,
+        sampling_rate * block_align,
+        block_align,
+        sample_width * 8,
+        b"data",
+        data_bytes,
+    )
+
+
+def to_pcm16(audio: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    if isinstance(audio, np.ndarray) and audio.dtype == np.int16:
+        if out is None:
+            return audio
+        out[...] = audio
+        return out
+    pcm = np.clip(np.asarray(audio, dtype=np.float32), -1.0, 1.0)
+    np.multiply(pcm, 32767, out=pcm)
+    if out is None:
+        np.rint(pcm, out=pcm)
+        return pcm.astype(np.int16, copy=False)
+    np.rint(pcm, out=out, casting="unsafe")
+    return out
+
+
+def encode_wav_pcm16(audio: np.ndarray, sampling_rate: int) -> bytearray:
+    audio = np.asarray(audio)
+    data_bytes = audio.size * 2
+    buf = bytearray(_WAV_HEADER.size + data_bytes)
+    buf[:_WAV_HEADER.size] = wav_header(data_bytes, sampling_rate)
+    pcm = np.frombuffer(buf, dtype=np.int16, offset=_WAV_HEADER.size).reshape(audio.shape)
+    to_pcm16(audio, out=pcm)
+    return buf
+
+
+def write_wav_pcm16(path: Union[str, Path], audio: np.ndarray, sampling_rate: int) -> None:
+    pcm = np.ascontiguousarray(to_pcm16(audio))
+    with open(path, "wb", buffering=WAV_WRITE_BUFSIZE) as f:
+        f.write(wav_header(pcm.nbytes, sampling_rate))
+        f.write(pcm.data)
+
+
+def _copy_pcm16_frames(source: Union[str, Path], out: BinaryIO, sampling_rate: int, blocksize: int) -> int:
+    copied = 0
+    try:
+        src = wave.open(str(source), "rb")
+    except (wave.Error, EOFError):
+        src = None
+    
+    if src is not None:
+        with src:
+            if (src.getnchannels(), src.getsampwidth(), src.getframerate()) == (1, 2, sampling_rate):
+                while True:
+                    frames = src.readframes(blocksize)
+                    if not frames:
+                        return copied
+                    out.write(frames)
+                    copied += len(frames)
+    
+    with sf.SoundFile(str(source)) as src:
+        for block in src.blocks(blocksize=blocksize, dtype="int16"):
+            out.write(block.tobytes())
+            copied += block.nbytes
+    return copied
+
+
+def concat_wav_pcm16(
+    sources: Iterable[Union[str, Path]],
+    path: Union[str, Path],
+    sampling_rate: int,
+    blocksize: int = 65536
+) -> None:
+    with open(path, "wb", buffering=WAV_WRITE_BUFSIZE) as out:
+        out.write(wav_header(0, sampling_rate))
+        data_bytes = 0
+        for source in sources:
+            data_bytes += _copy_pcm16_frames(source, out, sampling_rate, blocksize)
+        out.seek(0)
+        out.write(wav_header(data_bytes, sampling_rate))
+
+
+def _safe_inside(path: Path, base: Path) -> bool:
+    try:
+        path.resolve().relative_to(base.resolve())
+        return True
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=1024)
+def resolve_audio_file(filename: str) -> Optional[str]:
+    for directory in (STORAGE_DIR, SAVED_AUDIO_DIR, CLONED_VOICES_DIR):
+        path = directory / filename
+        if path.exists() and _safe_inside(path, directory):
+            return path.as_posix()
+    return None
+
+
+def invalidate_audio_lookup() -> None:
+    resolve_audio_file.cache_clear()
\ No newline at end of file
@@ -1,15 +1,23 @@
 import asyncio
-import json
+import atexit
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-import openai
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
+TTS_WARMUP = os.environ.get("TTS_WARMUP", "1") != "0"
+
+# Chunks request very different max_new_tokens; expandable segments keep the
+# caching allocator from fragmenting across them. Must be set before torch loads.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 STORAGE_DIR = BASE_DIR / "generated_audio"
@@ -27,18 +35,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger("emberglow")
 
-generation_lock = asyncio.Lock()
+# Every serve_engine.generate call runs on this single thread, which keeps the
+# model serialized without an extra asyncio lock around each job.
+generation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="generation")
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-openai_client: Optional[openai.AsyncOpenAI] = (
-    openai.AsyncOpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
-)
+openai_client: Optional[Any] = None
+if OPENAI_API_KEY:
+    # Only pay for importing the OpenAI SDK when normalization is configured.
+    import openai
+    openai_client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+
+def write_json_atomic(path: Path, payload: Any, indent: bool = True) -> None:
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else None))
+    os.replace(tmp, path)
 
 
 def load_saved_audio() -> Dict[str, Any]:
     if SAVED_AUDIO_METADATA_FILE.exists():
         try:
-            return json.loads(SAVED_AUDIO_METADATA_FILE.read_text())
+            return orjson.loads(SAVED_AUDIO_METADATA_FILE.read_bytes())
         except Exception:
             return {}
     return {}
@@ -46,9 +64,35 @@ def load_saved_audio() -> Dict[str, Any]:
 
 def save_saved_audio(payload: Dict[str, Any]) -> None:
     try:
-        SAVED_AUDIO_METADATA_FILE.write_text(json.dumps(payload, indent=2))
+        write_json_atomic(SAVED_AUDIO_METADATA_FILE, payload)
     except Exception:
         pass
 
 
-saved_audio: Dict[str, Any] = load_saved_audio()
\ No newline at end of file
+saved_audio: Dict[str, Any] = load_saved_audio()
+
+SAVED_AUDIO_FLUSH_INTERVAL = 5.0
+
+_saved_audio_dirty = False
+
+
+def mark_saved_audio_dirty() -> None:
+    global _saved_audio_dirty
+    _saved_audio_dirty = True
+
+
+def flush_saved_audio() -> None:
+    global _saved_audio_dirty
+    if not _saved_audio_dirty:
+        return
+    _saved_audio_dirty = False
+    save_saved_audio(dict(saved_audio))
+
+
+async def saved_audio_flusher() -> None:
+    while True:
+        await asyncio.sleep(SAVED_AUDIO_FLUSH_INTERVAL)
+        await asyncio.to_thread(flush_saved_audio)
+
+
+atexit.register(flush_saved_audio)
\ No newline at end of file
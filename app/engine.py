@@ -1,6 +1,12 @@
+import time
+from typing import Union
+
+# app.config defaults PYTORCH_CUDA_ALLOC_CONF, so it must load before torch.
+from app.config import TTS_WARMUP, logger
+
 import torch
 
-from app.config import logger
+from boson_multimodal.data_types import ChatMLSample, Message
 from boson_multimodal.serve.serve_engine import HiggsAudioServeEngine
 
 
@@ -16,14 +22,41 @@ def _detect_device() -> str:
     return "cpu"
 
 
+def _select_dtype(device: str) -> Union[torch.dtype, str]:
+    if device == "cuda" and torch.cuda.is_bf16_supported():
+        return torch.bfloat16
+    return "auto"
+
+
 DEVICE = _detect_device()
-logger.info(f"Device: {DEVICE}")
+DTYPE = _select_dtype(DEVICE)
+logger.info(f"Device: {DEVICE}, dtype: {DTYPE}")
 
 serve_engine = HiggsAudioServeEngine(
     "bosonai/higgs-audio-v2-generation-3B-base",
     "bosonai/higgs-audio-v2-tokenizer",
     device=DEVICE,
+    torch_dtype=DTYPE,
 )
 
+
+def _warmup() -> None:
+    start = time.time()
+    try:
+        serve_engine.generate(
+            chat_ml_sample=ChatMLSample(messages=[Message(role="user", content="Hello.")]),
+            max_new_tokens=64,
+            stop_strings=["<|end_of_text|>", "<|eot_id|>"],
+            temperature=0.2,
+            top_p=0.95,
+        )
+        logger.info(f"Warm-up generation finished in {time.time() - start:.1f}s")
+    except Exception as e:
+        logger.warning(f"Warm-up generation failed: {e}")
+
+
+if TTS_WARMUP and DEVICE == "cuda":
+    _warmup()
+
 logger.info(f"Model ready on {serve_engine.device}")
 SAMPLING_RATE = serve_engine.audio_tokenizer.sampling_rate
\ No newline at end of file
@@ -1,8 +1,20 @@
+import asyncio
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from app.config import openai_client, logger
 
+_WS_RE = re.compile(r"\s+")
+_SENT_RE = re.compile(r"(?<=[.?!])\s+")
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+OPENING_QUOTES = ('"', '"', '«', '„')
+MIN_TAIL_CHUNK_FRACTION = 0.25
+NORMALIZATION_MODEL = "gpt-4o-mini"
+NORMALIZATION_MAX_TOKENS = 16384
+NORMALIZATION_PIECE_WORDS = 1800
+NORMALIZATION_CONCURRENCY = 8
+
 TTS_NORMALIZATION_PROMPT = """You are a master scriptwriter and editor specializing in creating content for Text-to-Speech (TTS) engines. Your sole purpose is to produce text that is perfectly clear, unambiguous, and effortless for an AI voice to narrate.
 You will operate according to the following **Core Narration Rules** at all times.
 
@@ -120,60 +132,128 @@ Determine the correct mode from my instructions and proceed.
 """
 
 
-async def normalize_text_with_openai(text: str) -> str:
+async def normalize_text_with_openai(text: str) -> Tuple[str, bool]:
     if not openai_client:
-        return text
+        return text, False
+    
+    pieces = _split_for_normalization(text, NORMALIZATION_PIECE_WORDS)
+    if len(pieces) <= 1:
+        return await _normalize_piece(text)
+    
+    semaphore = asyncio.Semaphore(NORMALIZATION_CONCURRENCY)
+    
+    async def _bounded(piece: str) -> Tuple[str, bool]:
+        async with semaphore:
+            return await _normalize_piece(piece)
+    
+    results = await asyncio.gather(*(_bounded(piece) for _, piece in pieces))
+    parts: List[str] = []
+    for i, ((separator, _), (normalized, _)) in enumerate(zip(pieces, results)):
+        if i:
+            parts.append(separator)
+        parts.append(normalized)
+    return "".join(parts), any(was_normalized for _, was_normalized in results)
+
+
+def _split_for_normalization(text: str, max_words: int) -> List[Tuple[str, str]]:
+    # Each piece carries the separator joining it to the previous one, so a paragraph
+    # split across pieces is rejoined with spaces rather than paragraph breaks.
+    pieces: List[Tuple[str, str]] = []
+    current = ""
+    current_separator = ""
+    current_words = 0
+    
+    def _add(part: str, words: int, separator: str) -> None:
+        nonlocal current, current_separator, current_words
+        if current and current_words + words > max_words:
+            pieces.append((current_separator, current))
+            current, current_words = "", 0
+        if current:
+            current += separator + part
+        else:
+            current, current_separator = part, separator
+        current_words += words
+    
+    for paragraph in _PARAGRAPH_RE.split(text.strip()):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        
+        paragraph_words = len(paragraph.split())
+        if paragraph_words <= max_words:
+            _add(paragraph, paragraph_words, "\n\n")
+            continue
+        
+        separator = "\n\n"
+        for sentence in _SENT_RE.split(paragraph):
+            if sentence:
+                _add(sentence, len(sentence.split()), separator)
+                separator = " "
     
+    if current:
+        pieces.append((current_separator, current))
+    return pieces
+
+
+async def _normalize_piece(text: str) -> Tuple[str, bool]:
     try:
         response = await openai_client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=NORMALIZATION_MODEL,
             messages=[
                 {"role": "system", "content": TTS_NORMALIZATION_PROMPT},
                 {"role": "user", "content": f"Apply your rules to the following text:\n\n---\n\n{text}"}
             ],
             temperature=0.1,
-            max_tokens=len(text.split()) * 2 + 500
+            max_tokens=min(NORMALIZATION_MAX_TOKENS, len(text.split()) * 2 + 500)
         )
         
         normalized = (response.choices[0].message.content or "").strip()
-        return normalized or text
+        if not normalized:
+            return text, False
+        return normalized, normalized != text
     except Exception as e:
         logger.warning(f"Normalization failed: {e}")
-        return text
+        return text, False
 
 
+@lru_cache(maxsize=256)
 def normalize_text_for_tts(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
 
 
 def split_text_into_chunks(text: str, words_per_chunk: int = 100) -> List[str]:
-    sentences = re.split(r'(?<=[.?!])\s+', text.strip())
+    return list(_split_text_into_chunks(text, words_per_chunk))
+
+
+@lru_cache(maxsize=256)
+def _split_text_into_chunks(text: str, words_per_chunk: int) -> Tuple[str, ...]:
+    sentences = _SENT_RE.split(text.strip())
     chunks: List[str] = []
-    current = ""
+    current_parts: List[str] = []
+    current_words = 0
     
     for sentence in sentences:
         sentence = sentence.strip()
         if not sentence:
             continue
         
-        combined = (current + " " + sentence).strip()
-        if current and len(combined.split()) > words_per_chunk:
-            chunks.append(current.strip())
-            current = sentence
+        sentence_words = len(sentence.split())
+        if current_parts and current_words + sentence_words > words_per_chunk:
+            chunks.append(" ".join(current_parts))
+            current_parts = [sentence]
+            current_words = sentence_words
         else:
-            current = combined
+            current_parts.append(sentence)
+            current_words += sentence_words
     
-    if current:
-        chunks.append(current.strip())
-    
-    OPENING_QUOTES = ('"', '"', '«', '„')
-    sentence_splitter = re.compile(r'(?<=[.?!])\s+')
+    if current_parts:
+        chunks.append(" ".join(current_parts))
     
     i = 1
     while i < len(chunks):
         leading = chunks[i].lstrip()
         if leading and leading[0] in OPENING_QUOTES:
-            parts = sentence_splitter.split(chunks[i], maxsplit=1)
+            parts = _SENT_RE.split(chunks[i], maxsplit=1)
             
             if len(parts) == 1:
                 chunks[i-1] = (chunks[i-1].rstrip() + " " + chunks[i].lstrip()).strip()
@@ -186,4 +266,10 @@ def split_text_into_chunks(text: str, words_per_chunk: int = 100) -> List[str]:
                 continue
         i += 1
     
-    return [chunk for chunk in chunks if chunk]
\ No newline at end of file
+    chunks = [chunk for chunk in chunks if chunk]
+    # A few trailing words would otherwise cost a full generate call of their own.
+    if len(chunks) > 1 and len(chunks[-1].split()) < words_per_chunk * MIN_TAIL_CHUNK_FRACTION:
+        tail = chunks.pop()
+        chunks[-1] = f"{chunks[-1]} {tail}"
+    
+    return tuple(chunks)
\ No newline at end of file
@@ -1,14 +1,16 @@
 import asyncio
-import base64
-import json
+import os
+import shutil
+import threading
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set, Tuple, Callable, Awaitable
 
 import numpy as np
-import soundfile as sf
+import orjson
 
 from app.config import (
     STORAGE_DIR,
@@ -16,10 +18,12 @@ from app.config import (
     SAVED_AUDIO_DIR,
     PROJECTS_DIR,
     saved_audio,
-    save_saved_audio,
-    generation_lock,
+    mark_saved_audio_dirty,
+    generation_executor,
     logger,
+    write_json_atomic,
 )
+from app.audio import concat_wav_pcm16, write_wav_pcm16, invalidate_audio_lookup
 from app.engine import serve_engine, SAMPLING_RATE
 from app.normalization import (
     normalize_text_for_tts,
@@ -29,14 +33,144 @@ from app.normalization import (
 from boson_multimodal.data_types import ChatMLSample, Message, AudioContent
 
 
+GenerationJob = Tuple[Callable[..., Awaitable[None]], Tuple[Any, ...]]
+
+_generation_queue: Optional["asyncio.Queue[GenerationJob]"] = None
+
+
+STITCH_BLOCKSIZE = 65536
+ACTIVE_STATUSES = ("pending", "processing", "normalizing")
+
+_audio_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-writer")
+_project_lock = threading.Lock()
+_live_projects: Dict[str, Dict[str, Any]] = {}
+_active_projects: Dict[str, Dict[str, Any]] = {}
+_preparing_projects: Set["asyncio.Task[None]"] = set()
+
+
+def _get_generation_queue() -> "asyncio.Queue[GenerationJob]":
+    global _generation_queue
+    if _generation_queue is None:
+        _generation_queue = asyncio.Queue()
+    return _generation_queue
+
+
+async def generation_worker() -> None:
+    queue = _get_generation_queue()
+    while True:
+        func, args = await queue.get()
+        try:
+            await func(*args)
+        except Exception as e:
+            logger.error(f"Generation job {func.__name__}{args} failed: {e}")
+        finally:
+            queue.task_done()
+
+
+def enqueue_project(project_id: str) -> None:
+    task = asyncio.create_task(prepare_project(project_id))
+    _preparing_projects.add(task)
+    task.add_done_callback(_preparing_projects.discard)
+
+
+def _enqueue_generation(project_id: str) -> None:
+    _get_generation_queue().put_nowait((process_project_background, (project_id,)))
+
+
+def enqueue_chunk_regeneration(project_id: str, chunk_index: int) -> None:
+    _get_generation_queue().put_nowait((regenerate_chunk_async, (project_id, chunk_index)))
+
+
+def resume_interrupted_projects() -> int:
+    resumed = 0
+    with os.scandir(PROJECTS_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            
+            project_id = entry.name[:-5]
+            try:
+                project = _read_project(project_id)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable project {project_id}: {e}")
+                continue
+            
+            _track_active(project)
+            status = project.get("status")
+            if status == "cancelling":
+                cleanup_project_data(project_id)
+                continue
+            if status not in ("normalizing", "processing"):
+                interrupted = [c for c in project.get("chunks", []) if c.get("status") == "processing"]
+                for chunk in interrupted:
+                    chunk["status"] = "failed"
+                    chunk["error"] = "Interrupted by server restart"
+                if interrupted:
+                    project["status"] = "review"
+                    update_project_progress(project)
+                    _write_project(project)
+                continue
+            
+            if status == "processing" and project.get("chunks"):
+                for chunk in project["chunks"]:
+                    if chunk.get("status") == "processing":
+                        chunk["status"] = "pending"
+                _write_project(project)
+                _enqueue_generation(project_id)
+            else:
+                enqueue_project(project_id)
+            resumed += 1
+    
+    if resumed:
+        logger.info(f"Resumed {resumed} interrupted project(s)")
+    return resumed
+
+
 def _read_project(project_id: str) -> Dict[str, Any]:
+    live = _live_projects.get(project_id)
+    if live is not None:
+        return live
     path = PROJECTS_DIR / f"{project_id}.json"
-    return json.loads(path.read_text())
+    return orjson.loads(path.read_bytes())
+
+
+def load_project(project_id: str) -> Dict[str, Any]:
+    with _project_lock:
+        live = _live_projects.get(project_id)
+        if live is not None:
+            return orjson.loads(orjson.dumps(live))
+    return orjson.loads((PROJECTS_DIR / f"{project_id}.json").read_bytes())
 
 
 def _write_project(project: Dict[str, Any]) -> None:
-    path = PROJECTS_DIR / f"{project['id']}.json"
-    path.write_text(json.dumps(project, indent=2))
+    # Rewritten on every chunk transition, so skip the pretty-printing.
+    write_json_atomic(PROJECTS_DIR / f"{project['id']}.json", project, indent=False)
+    _track_active(project)
+
+
+def _track_active(project: Dict[str, Any]) -> None:
+    if project.get("status") in ACTIVE_STATUSES:
+        _active_projects[project["id"]] = {
+            "id": project["id"],
+            "name": project.get("name", "Unnamed Project"),
+            "status": project["status"]
+        }
+    else:
+        _active_projects.pop(project["id"], None)
+
+
+def get_active_projects() -> List[Dict[str, Any]]:
+    return list(_active_projects.values())
+
+
+def request_project_cancel(project_id: str) -> bool:
+    with _project_lock:
+        project = _read_project(project_id)
+        if project.get("status") not in ACTIVE_STATUSES:
+            return False
+        project["status"] = "cancelling"
+        _write_project(project)
+    return True
 
 
 def update_project_progress(project: Dict[str, Any]) -> None:
@@ -48,53 +182,78 @@ def update_project_progress(project: Dict[str, Any]) -> None:
 
 
 def cleanup_project_data(project_id: str) -> None:
+    with _project_lock:
+        live = _live_projects.get(project_id)
+        if live is not None:
+            # Deleting under a running generation would only have it write the
+            # files back; it removes them itself once it sees the cancel.
+            live["status"] = "cancelling"
+            _write_project(live)
+            return
+        # Still under the lock, so a generation cannot load the project between
+        # the check above and the delete.
+        _delete_project_data(project_id)
+
+
+def _delete_project_data(project_id: str) -> None:
+    _active_projects.pop(project_id, None)
     try:
         path = PROJECTS_DIR / f"{project_id}.json"
-        if not path.exists():
+        try:
+            project = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
             return
         
-        project = json.loads(path.read_text())
         for chunk in project.get("chunks", []):
             filename = chunk.get("audio_filename")
             if not filename:
                 continue
             
-            filepath = STORAGE_DIR / filename
-            if filepath.exists():
-                try:
-                    filepath.unlink()
-                except Exception:
-                    pass
+            try:
+                (STORAGE_DIR / filename).unlink(missing_ok=True)
+            except Exception:
+                pass
         
         path.unlink(missing_ok=True)
+        invalidate_audio_lookup()
     except Exception as e:
         logger.warning(f"Cleanup failed for {project_id}: {e}")
 
 
-def _context_messages(project: Dict[str, Any], chunk_index: int = 0) -> List[Message]:
-    messages: List[Message] = []
+REFERENCE_PROMPT = Message(role="user", content="Reference audio")
+
+
+def _reference_messages(audio: AudioContent) -> List[Message]:
+    return [REFERENCE_PROMPT, Message(role="assistant", content=audio)]
+
+
+def _context_messages(
+    project: Dict[str, Any],
+    chunk_index: int = 0,
+    reference_audio: Optional[np.ndarray] = None
+) -> List[Message]:
     ref_path = project.get("voice_ref_path")
     
     def _audio_message_from_path(path: Path) -> List[Message]:
-        raw = path.read_bytes()
-        b64 = base64.b64encode(raw).decode("utf-8")
-        return [
-            Message(role="user", content="Reference audio"),
-            Message(role="assistant", content=AudioContent(raw_audio=b64, audio_url="placeholder")),
-        ]
+        if not path.exists():
+            return []
+        return _reference_messages(AudioContent(audio_url=path.as_posix()))
+    
+    if chunk_index > 0 and reference_audio is not None:
+        return _reference_messages(
+            AudioContent(audio_url="placeholder", waveform=reference_audio, sampling_rate=SAMPLING_RATE)
+        )
     
     if chunk_index == 0:
-        if ref_path and Path(ref_path).exists():
-            messages = _audio_message_from_path(Path(ref_path))
-    else:
-        first_chunk = project["chunks"][0]
-        filename = first_chunk.get("audio_filename")
-        if first_chunk.get("status") == "completed" and filename:
-            filepath = STORAGE_DIR / filename
-            if filepath.exists():
-                messages = _audio_message_from_path(filepath)
+        if ref_path:
+            return _audio_message_from_path(Path(ref_path))
+        return []
     
-    return messages
+    first_chunk = project["chunks"][0]
+    filename = first_chunk.get("audio_filename")
+    if first_chunk.get("status") == "completed" and filename:
+        return _audio_message_from_path(STORAGE_DIR / filename)
+    return []
 
 
 def _generate_chunk(
@@ -121,24 +280,21 @@ def _generate_chunk(
 
 async def normalize_single_chunk(text: str) -> str:
     try:
-        normalized = await normalize_text_with_openai(text)
+        normalized, _ = await normalize_text_with_openai(text)
         return normalize_text_for_tts(normalized)
     except Exception as e:
         logger.warning(f"Failed to normalize chunk: {e}")
         return normalize_text_for_tts(text)
 
 
-async def process_project_background(project_id: str) -> None:
-    async with generation_lock:
-        path = PROJECTS_DIR / f"{project_id}.json"
-        project = json.loads(path.read_text())
+async def prepare_project(project_id: str) -> None:
+    try:
+        project = _read_project(project_id)
         source = project.get("original_text", "")
         
         if project.get("auto_normalize"):
-            project["status"] = "normalizing"
-            _write_project(project)
-            normalized = await normalize_text_with_openai(source)
-            project["was_normalized"] = normalized != source
+            normalized, was_normalized = await normalize_text_with_openai(source)
+            project["was_normalized"] = was_normalized
             project["normalized_text"] = normalized if project["was_normalized"] else None
             text_for_chunks = normalize_text_for_tts(normalized)
         else:
@@ -154,45 +310,136 @@ async def process_project_background(project_id: str) -> None:
             for i, chunk in enumerate(split_text_into_chunks(text_for_chunks))
         ]
         
-        project["status"] = "processing"
-        _write_project(project)
+        with _project_lock:
+            cancelled = _read_project(project_id).get("status") == "cancelling"
+            if not cancelled:
+                project["status"] = "processing"
+                _write_project(project)
         
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, _process_generation_sync, project_id)
+        if cancelled:
+            cleanup_project_data(project_id)
+            return
+        
+        _enqueue_generation(project_id)
+    except Exception as e:
+        logger.error(f"Preparing project {project_id} failed: {e}")
 
 
-def _process_generation_sync(project_id: str) -> None:
-    path = PROJECTS_DIR / f"{project_id}.json"
-    project = json.loads(path.read_text())
+async def process_project_background(project_id: str) -> None:
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(generation_executor, _process_generation_sync, project_id, loop)
+
+
+def _finish_chunk(
+    project_id: str,
+    index: int,
+    audio: Optional[np.ndarray],
+    start_time: float,
+    normalized_text: Optional[str],
+    copy_from: Optional[int] = None
+) -> None:
+    filename = f"{project_id}_chunk_{index}.wav"
+    error: Optional[str] = None
+    try:
+        if copy_from is None:
+            write_wav_pcm16(STORAGE_DIR / filename, audio, SAMPLING_RATE)
+        else:
+            shutil.copyfile(STORAGE_DIR / f"{project_id}_chunk_{copy_from}.wav", STORAGE_DIR / filename)
+        invalidate_audio_lookup()
+    except Exception as e:
+        error = str(e)
+    
+    with _project_lock:
+        project = _read_project(project_id)
+        chunk = project["chunks"][index]
+        if normalized_text is not None:
+            chunk["normalized_text"] = normalized_text
+        
+        if error:
+            chunk["status"] = "failed"
+            chunk["error"] = error
+        else:
+            chunk["status"] = "completed"
+            chunk["audio_filename"] = filename
+            chunk["error"] = None
+            if index == 0:
+                project["voice_ref_path"] = (STORAGE_DIR / filename).as_posix()
+        
+        chunk["elapsed_time"] = time.time() - start_time
+        update_project_progress(project)
+        _write_project(project)
+
+
+def _process_generation_sync(project_id: str, loop: asyncio.AbstractEventLoop) -> None:
+    with _project_lock:
+        _live_projects[project_id] = _read_project(project_id)
+    try:
+        _generate_project_chunks(project_id, loop)
+    finally:
+        with _project_lock:
+            project = _live_projects.pop(project_id, None)
+        if project is not None and project.get("status") == "cancelling":
+            _delete_project_data(project_id)
+
+
+def _generate_project_chunks(project_id: str, loop: asyncio.AbstractEventLoop) -> None:
+    project = _read_project(project_id)
     num_chunks = len(project.get("chunks", []))
+    auto_normalize = bool(project.get("auto_normalize"))
+    reference_audio: Optional[np.ndarray] = None
+    pending_writes: List[Future] = []
+    pending_normalizations: Dict[int, Future] = {}
+    # Every chunk after the first is generated against the same reference, so a
+    # repeated text can reuse the file written for its first occurrence.
+    rendered: Dict[str, int] = {}
+    
+    def _prefetch_normalization(index: int) -> None:
+        if index >= num_chunks or index in pending_normalizations:
+            return
+        chunk = project["chunks"][index]
+        if chunk.get("status") != "completed":
+            # The OpenAI client's connection pool belongs to the app loop, so the
+            # request runs there while this thread keeps generating.
+            pending_normalizations[index] = asyncio.run_coroutine_threadsafe(
+                normalize_single_chunk(chunk["text"]), loop
+            )
     
     for i in range(num_chunks):
-        project = json.loads(path.read_text())
-        if project.get("status") == "cancelling":
-            cleanup_project_data(project_id)
+        with _project_lock:
+            project = _read_project(project_id)
+            cancelled = project.get("status") == "cancelling"
+            chunk = project["chunks"][i]
+            if not cancelled and chunk.get("status") != "completed":
+                start_time = time.time()
+                chunk["status"] = "processing"
+                chunk["start_time"] = start_time
+                _write_project(project)
+        
+        if cancelled:
+            for future in pending_normalizations.values():
+                future.cancel()
+            wait(pending_writes)
             return
         
-        chunk = project["chunks"][i]
         if chunk.get("status") == "completed":
             continue
         
-        chunk["status"] = "processing"
-        chunk["start_time"] = time.time()
-        _write_project(project)
-        
         try:
             chunk_text = chunk["text"]
-            if project.get("auto_normalize"):
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    normalized_text = loop.run_until_complete(normalize_single_chunk(chunk_text))
-                    chunk["normalized_text"] = normalized_text
-                    chunk_text = normalized_text
-                finally:
-                    loop.close()
+            normalized_text: Optional[str] = None
+            if auto_normalize:
+                _prefetch_normalization(i)
+                _prefetch_normalization(i + 1)
+                normalized_text = pending_normalizations.pop(i).result()
+                chunk_text = normalized_text
+            
+            if i > 0 and chunk_text in rendered:
+                pending_writes.append(_audio_writer.submit(
+                    _finish_chunk, project_id, i, None, start_time, normalized_text, rendered[chunk_text]
+                ))
+                continue
             
-            context = _context_messages(project, i)
+            context = _context_messages(project, i, reference_audio)
             audio = _generate_chunk(
                 chunk_text,
                 project["params"]["temperature"],
@@ -200,90 +447,134 @@ def _process_generation_sync(project_id: str) -> None:
                 context
             )
             
-            filename = f"{project_id}_chunk_{i}.wav"
-            sf.write((STORAGE_DIR / filename).as_posix(), audio, SAMPLING_RATE)
-            
-            project = json.loads(path.read_text())
-            chunk = project["chunks"][i]
-            chunk["status"] = "completed"
-            chunk["audio_filename"] = filename
-            chunk["error"] = None
-            
             if i == 0:
-                project["voice_ref_path"] = (STORAGE_DIR / filename).as_posix()
+                reference_audio = audio
+            else:
+                rendered.setdefault(chunk_text, i)
+            
+            pending_writes.append(
+                _audio_writer.submit(_finish_chunk, project_id, i, audio, start_time, normalized_text)
+            )
         
         except Exception as e:
-            project = json.loads(path.read_text())
-            project["chunks"][i]["status"] = "failed"
-            project["chunks"][i]["error"] = str(e)
-        
-        finally:
-            chunk = project["chunks"][i]
-            chunk["elapsed_time"] = time.time() - chunk.get("start_time", time.time())
-            update_project_progress(project)
-            _write_project(project)
+            with _project_lock:
+                project = _read_project(project_id)
+                chunk = project["chunks"][i]
+                chunk["status"] = "failed"
+                chunk["error"] = str(e)
+                chunk["elapsed_time"] = time.time() - start_time
+                update_project_progress(project)
+                _write_project(project)
     
-    project = json.loads(path.read_text())
-    all_completed = all(c["status"] == "completed" for c in project["chunks"])
-    project["status"] = "completed" if all_completed else "review"
-    _write_project(project)
+    wait(pending_writes)
+    with _project_lock:
+        project = _read_project(project_id)
+        if project.get("status") != "cancelling":
+            all_completed = all(c["status"] == "completed" for c in project["chunks"])
+            project["status"] = "completed" if all_completed else "review"
+            _write_project(project)
 
 
 async def regenerate_chunk_async(project_id: str, chunk_index: int) -> None:
-    async with generation_lock:
-        await _regenerate_chunk_sync(project_id, chunk_index)
-
-
-async def _regenerate_chunk_sync(project_id: str, chunk_index: int) -> None:
-    path = PROJECTS_DIR / f"{project_id}.json"
-    project = json.loads(path.read_text())
-    chunk = project["chunks"][chunk_index]
-    
-    old_filename = chunk.get("audio_filename")
-    if old_filename:
-        old_path = STORAGE_DIR / old_filename
-        if old_path.exists():
-            try:
-                old_path.unlink()
-            except Exception:
-                pass
-    
-    chunk["status"] = "processing"
-    chunk["start_time"] = time.time()
-    chunk["error"] = None
-    chunk["audio_filename"] = None
-    _write_project(project)
+    loop = asyncio.get_running_loop()
+    project = await loop.run_in_executor(
+        generation_executor, _start_chunk_regeneration, project_id, chunk_index
+    )
+    if project is None:
+        return
     
+    chunk = project["chunks"][chunk_index]
+    start_time = chunk["start_time"]
+    normalized_text: Optional[str] = None
+    filename: Optional[str] = None
+    error: Optional[str] = None
     try:
         chunk_text = chunk.get("original_text", chunk["text"])
         
         if project.get("auto_normalize"):
             normalized_text = await normalize_single_chunk(chunk_text)
-            chunk["normalized_text"] = normalized_text
             chunk_text = normalized_text
         
-        context = _context_messages(project, chunk_index)
-        audio = _generate_chunk(
-            chunk_text,
-            project["params"]["temperature"],
-            project["params"]["top_p"],
-            context
-        )
+        def _render(text: str, filename: str) -> None:
+            context = _context_messages(project, chunk_index)
+            audio = _generate_chunk(
+                text,
+                project["params"]["temperature"],
+                project["params"]["top_p"],
+                context
+            )
+            write_wav_pcm16(STORAGE_DIR / filename, audio, SAMPLING_RATE)
         
         filename = f"{project_id}_chunk_{chunk_index}_regen_{int(time.time())}.wav"
-        sf.write((STORAGE_DIR / filename).as_posix(), audio, SAMPLING_RATE)
-        chunk["status"] = "completed"
-        chunk["audio_filename"] = filename
-        
-        if chunk_index == 0:
-            project["voice_ref_path"] = (STORAGE_DIR / filename).as_posix()
+        await loop.run_in_executor(generation_executor, _render, chunk_text, filename)
+        invalidate_audio_lookup()
     
     except Exception as e:
-        chunk["status"] = "failed"
-        chunk["error"] = str(e)
+        filename = None
+        error = str(e)
     
     finally:
-        chunk["elapsed_time"] = time.time() - chunk.get("start_time", time.time())
+        await loop.run_in_executor(
+            generation_executor,
+            _finish_chunk_regeneration,
+            project_id, chunk_index, start_time, normalized_text, filename, error
+        )
+
+
+def _start_chunk_regeneration(project_id: str, chunk_index: int) -> Optional[Dict[str, Any]]:
+    with _project_lock:
+        try:
+            project = _read_project(project_id)
+        except FileNotFoundError:
+            return None
+        chunk = project["chunks"][chunk_index]
+        old_filename = chunk.get("audio_filename")
+        chunk["status"] = "processing"
+        chunk["start_time"] = time.time()
+        chunk["error"] = None
+        chunk["audio_filename"] = None
+        _write_project(project)
+        snapshot = orjson.loads(orjson.dumps(project))
+    
+    if old_filename:
+        try:
+            (STORAGE_DIR / old_filename).unlink(missing_ok=True)
+        except Exception:
+            pass
+    return snapshot
+
+
+def _finish_chunk_regeneration(
+    project_id: str,
+    chunk_index: int,
+    start_time: float,
+    normalized_text: Optional[str],
+    filename: Optional[str],
+    error: Optional[str]
+) -> None:
+    with _project_lock:
+        try:
+            project = _read_project(project_id)
+        except FileNotFoundError:
+            # Cleaned up while rendering; do not bring the project back.
+            if filename:
+                (STORAGE_DIR / filename).unlink(missing_ok=True)
+            return
+        
+        chunk = project["chunks"][chunk_index]
+        if normalized_text is not None:
+            chunk["normalized_text"] = normalized_text
+        
+        if filename:
+            chunk["status"] = "completed"
+            chunk["audio_filename"] = filename
+            if chunk_index == 0:
+                project["voice_ref_path"] = (STORAGE_DIR / filename).as_posix()
+        else:
+            chunk["status"] = "failed"
+            chunk["error"] = error
+        
+        chunk["elapsed_time"] = time.time() - start_time
         all_completed = all(c["status"] == "completed" for c in project["chunks"])
         project["status"] = "completed" if all_completed else "review"
         update_project_progress(project)
@@ -295,25 +586,31 @@ def stitch_project_audio(project_id: str) -> str:
     if not path.exists():
         raise ValueError("Project not found")
     
-    project = json.loads(path.read_text())
+    project = orjson.loads(path.read_bytes())
     ordered_chunks = [
-        chunk for chunk in sorted(project["chunks"], key=lambda x: x["index"])
+        chunk for chunk in project["chunks"]
         if chunk.get("status") == "completed" and chunk.get("audio_filename")
     ]
     
     if not ordered_chunks:
         raise ValueError("No completed audio chunks to stitch.")
     
-    arrays = []
-    for chunk in ordered_chunks:
-        data, _ = sf.read((STORAGE_DIR / chunk["audio_filename"]).as_posix())
-        arrays.append(data)
-    
-    final = np.concatenate(arrays)
     filename = f"{project_id}_final.wav"
-    sf.write((STORAGE_DIR / filename).as_posix(), final, SAMPLING_RATE)
-    project["final_audio_path"] = filename
-    _write_project(project)
+    final_path = STORAGE_DIR / filename
+    tmp_path = STORAGE_DIR / f"{filename}.tmp"
+    concat_wav_pcm16(
+        (STORAGE_DIR / chunk["audio_filename"] for chunk in ordered_chunks),
+        tmp_path,
+        SAMPLING_RATE,
+        STITCH_BLOCKSIZE,
+    )
+    os.replace(tmp_path, final_path)
+    invalidate_audio_lookup()
+    
+    with _project_lock:
+        project = _read_project(project_id)
+        project["final_audio_path"] = filename
+        _write_project(project)
     return filename
 
 
@@ -347,7 +644,7 @@ def create_project(
         "normalized_text": None,
     }
     
-    (PROJECTS_DIR / f"{project_id}.json").write_text(json.dumps(payload, indent=2))
+    _write_project(payload)
     return payload
 
 
@@ -362,7 +659,8 @@ def register_saved_audio(
     
     saved_id = f"saved_{uuid.uuid4().hex[:8]}"
     destination = SAVED_AUDIO_DIR / f"{saved_id}.wav"
-    destination.write_bytes(source.read_bytes())
+    shutil.copyfile(source, destination)
+    invalidate_audio_lookup()
     
     metadata = {
         "id": saved_id,
@@ -374,5 +672,5 @@ def register_saved_audio(
     }
     
     saved_audio[saved_id] = metadata
-    save_saved_audio(saved_audio)
+    mark_saved_audio_dirty()
     return metadata
\ No newline at end of file
@@ -1,39 +1,74 @@
-import base64
-import json
+import asyncio
+import os
+import shutil
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict
 
-import soundfile as sf
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks
+import librosa
+import numpy as np
+import orjson
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from app.config import (
-    STORAGE_DIR,
     CLONED_VOICES_DIR,
     SAVED_AUDIO_DIR,
     PROJECTS_DIR,
     OPENAI_API_KEY,
     saved_audio,
-    save_saved_audio,
-    generation_lock,
+    mark_saved_audio_dirty,
+    flush_saved_audio,
+    saved_audio_flusher,
+    generation_executor,
 )
 from app.projects import (
     create_project,
-    process_project_background,
+    load_project,
+    enqueue_project,
+    enqueue_chunk_regeneration,
+    generation_worker,
+    resume_interrupted_projects,
     stitch_project_audio,
     cleanup_project_data,
-    regenerate_chunk_async,
+    request_project_cancel,
+    get_active_projects,
     register_saved_audio,
+    REFERENCE_PROMPT,
 )
+from app.voices import (
+    list_cloned_voices,
+    read_voice_metadata,
+    write_voice_metadata,
+    invalidate_voices_cache,
+)
+from app.audio import encode_wav_pcm16, resolve_audio_file, invalidate_audio_lookup
 from app.engine import SAMPLING_RATE, serve_engine
 from boson_multimodal.data_types import ChatMLSample, Message, AudioContent
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    tasks = [
+        asyncio.create_task(generation_worker()),
+        asyncio.create_task(saved_audio_flusher()),
+    ]
+    resume_interrupted_projects()
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        flush_saved_audio()
+
+
 def create_app() -> FastAPI:
-    app = FastAPI(title="Emberglow-TTS API")
+    app = FastAPI(title="Emberglow-TTS API", lifespan=_lifespan)
     
     app.add_middleware(
         CORSMiddleware,
@@ -49,7 +84,6 @@ def create_app() -> FastAPI:
     
     @app.post("/project", status_code=202, tags=["Project"])
     async def start_project(
-        background_tasks: BackgroundTasks,
         text: str = Form(...),
         voice_id: str = Form(...),
         temperature: float = Form(0.2),
@@ -57,36 +91,24 @@ def create_app() -> FastAPI:
         auto_normalize: bool = Form(True),
     ):
         try:
-            payload = create_project(text, voice_id, temperature, top_p, auto_normalize)
-            background_tasks.add_task(process_project_background, payload["id"])
+            payload = await run_in_threadpool(
+                create_project, text, voice_id, temperature, top_p, auto_normalize
+            )
+            enqueue_project(payload["id"])
             return {"project_id": payload["id"], "status": payload["status"]}
         except FileNotFoundError as e:
             raise HTTPException(status_code=404, detail=str(e))
     
     @app.get("/project/{project_id}", tags=["Project"])
     async def get_project(project_id: str):
-        path = PROJECTS_DIR / f"{project_id}.json"
-        if not path.exists():
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        try:
-            data = json.loads(path.read_text())
-            data.pop("original_text", None)
-            data.pop("normalized_text", None)
-            return data
-        except json.JSONDecodeError:
-            raise HTTPException(
-                status_code=503,
-                detail="Project file is currently being updated. Please try again."
-            )
+        data = await _load_project(project_id)
+        data.pop("original_text", None)
+        data.pop("normalized_text", None)
+        return _json_response(data)
     
     @app.get("/project/{project_id}/normalized-text", tags=["Project"])
     async def get_normalized_text(project_id: str):
-        path = PROJECTS_DIR / f"{project_id}.json"
-        if not path.exists():
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        project = json.loads(path.read_text())
+        project = await _load_project(project_id)
         if not project.get("was_normalized"):
             raise HTTPException(status_code=404, detail="No normalized text available")
         
@@ -104,40 +126,25 @@ def create_app() -> FastAPI:
     
     @app.get("/active-projects", tags=["Project"])
     async def list_active_projects():
-        active = []
-        for filepath in PROJECTS_DIR.glob("*.json"):
-            try:
-                project = json.loads(filepath.read_text())
-                if project.get("status") in ["pending", "processing", "normalizing"]:
-                    active.append({
-                        "id": project["id"],
-                        "name": project.get("name", "Unnamed Project"),
-                        "status": project["status"]
-                    })
-            except Exception:
-                continue
-        return active
+        return _json_response(get_active_projects())
     
     @app.post("/project/{project_id}/stitch", tags=["Project"])
     async def stitch_audio(project_id: str):
         try:
-            filename = stitch_project_audio(project_id)
+            filename = await run_in_threadpool(stitch_project_audio, project_id)
             return {"final_audio_filename": filename}
         except (ValueError, FileNotFoundError) as e:
             raise HTTPException(status_code=400, detail=str(e))
     
     @app.post("/project/{project_id}/cancel", status_code=200, tags=["Project"])
     async def cancel_project(project_id: str):
-        path = PROJECTS_DIR / f"{project_id}.json"
-        if not path.exists():
+        try:
+            cancelled = await run_in_threadpool(request_project_cancel, project_id)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        data = json.loads(path.read_text())
-        if data.get("status") not in ["pending", "processing", "normalizing"]:
+        if not cancelled:
             return {"message": "Project is not in a cancellable state."}
-        
-        data["status"] = "cancelling"
-        path.write_text(json.dumps(data, indent=2))
         return {"message": "Project cancellation requested."}
     
     @app.post("/project/{project_id}/cleanup", status_code=200, tags=["Project"])
@@ -150,35 +157,18 @@ def create_app() -> FastAPI:
         return {"message": "Project cleanup has been scheduled."}
     
     @app.post("/project/{project_id}/chunk/{chunk_index}/regenerate", status_code=202, tags=["Project"])
-    async def regenerate_chunk(
-        project_id: str,
-        chunk_index: int,
-        background_tasks: BackgroundTasks
-    ):
-        path = PROJECTS_DIR / f"{project_id}.json"
-        if not path.exists():
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        project = json.loads(path.read_text())
+    async def regenerate_chunk(project_id: str, chunk_index: int):
+        project = await _load_project(project_id)
         if not 0 <= chunk_index < len(project.get("chunks", [])):
             raise HTTPException(status_code=400, detail="Invalid chunk index")
         
-        background_tasks.add_task(regenerate_chunk_async, project_id, chunk_index)
+        enqueue_chunk_regeneration(project_id, chunk_index)
         return {"message": f"Regeneration for chunk {chunk_index} has been queued."}
     
     @app.get("/voices", tags=["Voices"])
     async def list_voices():
         defaults = [{"id": "smart_voice", "name": "Smart Voice (Auto)"}]
-        clones = []
-        
-        if CLONED_VOICES_DIR.exists():
-            for filepath in CLONED_VOICES_DIR.glob("*.json"):
-                try:
-                    clones.append(json.loads(filepath.read_text()))
-                except Exception:
-                    continue
-        
-        return defaults + clones
+        return _json_response(defaults + await run_in_threadpool(list_cloned_voices))
     
     @app.post("/clone-voice", tags=["Voices"])
     async def clone_voice(
@@ -187,7 +177,8 @@ def create_app() -> FastAPI:
     ):
         voice_id = f"clone_{_generate_id()}"
         wav_path = CLONED_VOICES_DIR / f"{voice_id}.wav"
-        wav_path.write_bytes(await voice_sample.read())
+        await _save_upload(voice_sample, wav_path)
+        invalidate_audio_lookup()
         
         metadata = {
             "id": voice_id,
@@ -196,36 +187,35 @@ def create_app() -> FastAPI:
             "created_at": _timestamp()
         }
         
-        (CLONED_VOICES_DIR / f"{voice_id}.json").write_text(json.dumps(metadata, indent=2))
+        await run_in_threadpool(write_voice_metadata, voice_id, metadata)
         return metadata
     
     @app.put("/voices/{voice_id}", tags=["Voices"])
     async def rename_voice(voice_id: str, voice_data: dict):
         json_path = CLONED_VOICES_DIR / f"{voice_id}.json"
-        if not json_path.exists():
+        try:
+            metadata = await run_in_threadpool(read_voice_metadata, json_path)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Voice not found")
         
-        metadata = json.loads(json_path.read_text())
         if "name" in voice_data:
             metadata["name"] = voice_data["name"]
         
-        json_path.write_text(json.dumps(metadata, indent=2))
+        await run_in_threadpool(write_voice_metadata, voice_id, metadata)
         return metadata
     
     @app.delete("/voices/{voice_id}", tags=["Voices"])
     async def delete_voice(voice_id: str):
-        json_path = CLONED_VOICES_DIR / f"{voice_id}.json"
-        wav_path = CLONED_VOICES_DIR / f"{voice_id}.wav"
-        
-        if not json_path.exists():
-            raise HTTPException(status_code=404, detail="Voice not found")
-        
         try:
-            json_path.unlink(missing_ok=True)
-            wav_path.unlink(missing_ok=True)
+            deleted = await run_in_threadpool(_delete_voice_files, voice_id)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to delete voice: {e}")
         
+        if not deleted:
+            raise HTTPException(status_code=404, detail="Voice not found")
+        invalidate_voices_cache()
+        invalidate_audio_lookup()
+        
         return {"message": "Voice deleted successfully"}
     
     @app.post("/test-voice", tags=["Voices"])
@@ -238,42 +228,15 @@ def create_app() -> FastAPI:
         if not name.endswith((".wav", ".mp3", ".m4a", ".ogg")):
             raise HTTPException(status_code=400, detail="Invalid audio format")
         
-        async with generation_lock:
-            temp_path = STORAGE_DIR / f"test_voice_{_generate_id()}.wav"
-            temp_path.write_bytes(await audio.read())
-            
-            try:
-                b64 = base64.b64encode(temp_path.read_bytes()).decode("utf-8")
-                context = [
-                    Message(role="user", content="Reference audio"),
-                    Message(
-                        role="assistant",
-                        content=AudioContent(raw_audio=b64, audio_url="placeholder")
-                    )
-                ]
-                
-                output = serve_engine.generate(
-                    chat_ml_sample=ChatMLSample(
-                        messages=context + [Message(role="user", content=text)]
-                    ),
-                    max_new_tokens=len(text) // 3 + 256,
-                    stop_strings=["<|end_of_text|>", "<|eot_id|>"],
-                    temperature=float(temperature),
-                    top_p=0.95,
-                )
-                
-                if output.audio is None or len(output.audio) == 0:
-                    raise ValueError("Model produced no audio.")
-                
-                result_path = STORAGE_DIR / f"test_result_{_generate_id()}.wav"
-                sf.write(result_path.as_posix(), output.audio, SAMPLING_RATE)
-                
-                temp_path.unlink(missing_ok=True)
-                return FileResponse(result_path.as_posix(), media_type="audio/wav")
-            
-            except Exception as e:
-                temp_path.unlink(missing_ok=True)
-                raise HTTPException(status_code=500, detail=f"Voice test failed: {e}")
+        try:
+            loop = asyncio.get_running_loop()
+            wav = await loop.run_in_executor(
+                generation_executor, _render_voice_test, audio, text, float(temperature)
+            )
+            return Response(content=memoryview(wav), media_type="audio/wav")
+        
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Voice test failed: {e}")
     
     @app.post("/saved-audio", tags=["Saved Audio"])
     async def save_audio(
@@ -282,13 +245,13 @@ def create_app() -> FastAPI:
         audio_type: str = Form("standard")
     ):
         try:
-            return register_saved_audio(audio_filename, display_name, audio_type)
+            return await run_in_threadpool(register_saved_audio, audio_filename, display_name, audio_type)
         except FileNotFoundError as e:
             raise HTTPException(status_code=404, detail=str(e))
     
     @app.get("/saved-audio", tags=["Saved Audio"])
     async def list_saved_audio():
-        return list(saved_audio.values())
+        return _json_response(list(saved_audio.values()))
     
     @app.delete("/saved-audio/{saved_id}", tags=["Saved Audio"])
     async def delete_saved_audio(saved_id: str):
@@ -296,27 +259,37 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=404, detail="Saved audio not found")
         
         filepath = SAVED_AUDIO_DIR / saved_audio[saved_id]["filename"]
-        if filepath.exists():
-            try:
-                filepath.unlink()
-            except Exception:
-                pass
+        try:
+            await run_in_threadpool(filepath.unlink, missing_ok=True)
+        except Exception:
+            pass
         
+        invalidate_audio_lookup()
         del saved_audio[saved_id]
-        save_saved_audio(saved_audio)
+        mark_saved_audio_dirty()
         return {"message": "Audio deleted successfully"}
     
-    @app.get("/audio/{filename}", tags=["Audio"])
-    async def get_audio(filename: str):
+    @app.api_route("/audio/{filename}", methods=["GET", "HEAD"], tags=["Audio"])
+    async def get_audio(filename: str, request: Request):
         if filename != Path(filename).name:
             raise HTTPException(status_code=400, detail="Invalid filename")
         
-        for directory in (STORAGE_DIR, SAVED_AUDIO_DIR, CLONED_VOICES_DIR):
-            path = directory / filename
-            if path.exists() and _safe_inside(path, directory):
-                return FileResponse(path.as_posix(), media_type="audio/wav")
+        path = resolve_audio_file(filename)
+        try:
+            stat = os.stat(path) if path else None
+        except FileNotFoundError:
+            invalidate_audio_lookup()
+            stat = None
+        if stat is None:
+            raise HTTPException(status_code=404, detail="File not found")
         
-        raise HTTPException(status_code=404, detail="File not found")
+        headers = {
+            "ETag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            "Cache-Control": "no-cache",
+        }
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        return FileResponse(path, media_type="audio/wav", headers=headers, stat_result=stat)
     
     ui_assets = Path("ui/dist/assets")
     if ui_assets.exists():
@@ -335,17 +308,77 @@ def create_app() -> FastAPI:
     return app
 
 
-def _generate_id(length: int = 8) -> str:
-    return uuid.uuid4().hex[:length]
+UPLOAD_COPY_BUFSIZE = 1 << 20
 
 
-def _timestamp() -> str:
-    return datetime.now().isoformat()
+def _json_response(data: Any) -> Response:
+    return Response(content=orjson.dumps(data), media_type="application/json")
+
+
+async def _save_upload(upload: UploadFile, destination: Path) -> None:
+    def _copy() -> None:
+        upload.file.seek(0)
+        with open(destination, "wb") as out:
+            shutil.copyfileobj(upload.file, out, UPLOAD_COPY_BUFSIZE)
+    
+    await run_in_threadpool(_copy)
 
 
-def _safe_inside(path: Path, base: Path) -> bool:
+def _delete_voice_files(voice_id: str) -> bool:
+    json_path = CLONED_VOICES_DIR / f"{voice_id}.json"
     try:
-        path.resolve().relative_to(base.resolve())
-        return True
-    except Exception:
-        return False
\ No newline at end of file
+        json_path.unlink()
+    except FileNotFoundError:
+        return False
+    (CLONED_VOICES_DIR / f"{voice_id}.wav").unlink(missing_ok=True)
+    return True
+
+
+async def _load_project(project_id: str) -> Dict[str, Any]:
+    try:
+        return await run_in_threadpool(load_project, project_id)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+
+def _upload_waveform(upload: UploadFile) -> np.ndarray:
+    upload.file.seek(0)
+    waveform, _ = librosa.load(upload.file, sr=SAMPLING_RATE)
+    return waveform
+
+
+def _render_voice_test(upload: UploadFile, text: str, temperature: float) -> bytearray:
+    context = [
+        REFERENCE_PROMPT,
+        Message(
+            role="assistant",
+            content=AudioContent(
+                audio_url="placeholder",
+                waveform=_upload_waveform(upload),
+                sampling_rate=SAMPLING_RATE
+            )
+        )
+    ]
+    
+    output = serve_engine.generate(
+        chat_ml_sample=ChatMLSample(
+            messages=context + [Message(role="user", content=text)]
+        ),
+        max_new_tokens=len(text) // 3 + 256,
+        stop_strings=["<|end_of_text|>", "<|eot_id|>"],
+        temperature=temperature,
+        top_p=0.95,
+    )
+    
+    if output.audio is None or len(output.audio) == 0:
+        raise ValueError("Model produced no audio.")
+    
+    return encode_wav_pcm16(output.audio, SAMPLING_RATE)
+
+
+def _generate_id(length: int = 8) -> str:
+    return uuid.uuid4().hex[:length]
+
+
+def _timestamp() -> str:
+    return datetime.now().isoformat()
\ No newline at end of file
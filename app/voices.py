@@ -0,0 +1,64 @@
+import os
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import orjson
+
+from app.config import CLONED_VOICES_DIR, write_json_atomic
+
+_voices_cache: Dict[str, Any] = {"mtime": None, "v": None}
+_voice_meta: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def read_voice_metadata(path: Path) -> Dict[str, Any]:
+    return orjson.loads(path.read_bytes())
+
+
+def write_voice_metadata(voice_id: str, metadata: Dict[str, Any]) -> None:
+    write_json_atomic(CLONED_VOICES_DIR / f"{voice_id}.json", metadata)
+    invalidate_voices_cache()
+
+
+def invalidate_voices_cache() -> None:
+    _voices_cache["v"] = None
+
+
+def list_cloned_voices() -> List[Dict[str, Any]]:
+    try:
+        dir_mtime: Optional[int] = os.stat(CLONED_VOICES_DIR).st_mtime_ns
+    except FileNotFoundError:
+        dir_mtime = None
+    
+    cached: Optional[List[Dict[str, Any]]] = _voices_cache["v"]
+    if cached is not None and _voices_cache["mtime"] == dir_mtime:
+        return cached
+    
+    clones = []
+    seen = set()
+    try:
+        with os.scandir(CLONED_VOICES_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    mtime_ns = entry.stat().st_mtime_ns
+                    seen.add(entry.path)
+                    cached_meta = _voice_meta.get(entry.path)
+                    if cached_meta and cached_meta[0] == mtime_ns:
+                        clones.append(cached_meta[1])
+                        continue
+                    
+                    metadata = read_voice_metadata(Path(entry.path))
+                    _voice_meta[entry.path] = (mtime_ns, metadata)
+                    clones.append(metadata)
+                except Exception:
+                    continue
+    except FileNotFoundError:
+        pass
+    
+    for stale in _voice_meta.keys() - seen:
+        _voice_meta.pop(stale, None)
+    
+    _voices_cache["mtime"] = dir_mtime
+    _voices_cache["v"] = clones
+    return clones
\ No newline at end of file
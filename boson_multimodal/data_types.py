@@ -1,7 +1,7 @@
 """Basic data types for multimodal ChatML format."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 
 @dataclass
@@ -13,6 +13,10 @@ class AudioContent:
     duration: Optional[float] = None
     row_id: Optional[int] = None
     type: str = "audio"
+    # Already-decoded waveform (np.ndarray / torch.Tensor) for in-process callers;
+    # skips the base64 round-trip when set together with sampling_rate
+    waveform: Optional[Any] = None
+    sampling_rate: Optional[int] = None
 
 
 @dataclass
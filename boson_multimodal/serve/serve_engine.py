@@ -1,11 +1,14 @@
 import asyncio
 import base64
+import hashlib
+import os
 import torch
 import time
 import numpy as np
 from io import BytesIO
 from dataclasses import dataclass
 from typing import List, Optional, Union
+from collections import OrderedDict
 from copy import deepcopy
 from transformers import AutoTokenizer, AutoProcessor
 from transformers.cache_utils import StaticCache
@@ -139,6 +142,7 @@ class HiggsAudioServeEngine:
         device: str = "cuda",
         torch_dtype: Union[torch.dtype, str] = "auto",
         kv_cache_lengths: List[int] = [1024, 4096, 8192],
+        audio_ids_cache_size: int = 16,
     ):
         """
         Initialize the HiggsAudioServeEngine with all necessary attributes.
@@ -146,6 +150,8 @@ class HiggsAudioServeEngine:
         self.device = device
         self.model_name_or_path = model_name_or_path
         self.torch_dtype = torch_dtype
+        self.audio_ids_cache_size = audio_ids_cache_size
+        self._audio_ids_cache: "OrderedDict[tuple, torch.Tensor]" = OrderedDict()
 
         # Enable CUDA optimizations for RTX 4090
         if device == "cuda":
@@ -232,6 +238,50 @@ class HiggsAudioServeEngine:
         logger.info(f"Audio tokenizer device: {self.audio_tokenizer.device}")
         logger.info(f"Number of KV caches: {len(self.kv_caches)}")
 
+    def _encode_audio_content(self, audio_content) -> Optional[torch.Tensor]:
+        """
+        Return the audio codes for a reference clip, reusing the codes from earlier
+        requests when the same clip (same waveform or base64 payload by SHA-1, or same
+        file and mtime) is passed again, e.g. the voice reference repeated for every
+        chunk of a project or every project using the same cloned voice.
+        """
+        waveform = None
+        if audio_content.audio_url not in ["placeholder", ""]:
+            key = ("url", audio_content.audio_url, os.stat(audio_content.audio_url).st_mtime_ns)
+        elif audio_content.waveform is not None:
+            waveform = audio_content.waveform
+            if isinstance(waveform, torch.Tensor):
+                waveform = waveform.detach().cpu().numpy()
+            waveform = np.ascontiguousarray(waveform, dtype=np.float32).reshape(-1)
+            sampling_rate = audio_content.sampling_rate or self.audio_tokenizer.sampling_rate
+            key = ("wave", sampling_rate, hashlib.sha1(memoryview(waveform)).digest())
+        elif audio_content.raw_audio is not None:
+            key = ("b64", hashlib.sha1(audio_content.raw_audio.encode("ascii")).digest())
+        else:
+            return None
+
+        cached = self._audio_ids_cache.get(key)
+        if cached is not None:
+            self._audio_ids_cache.move_to_end(key)
+            return cached
+
+        if key[0] == "wave":
+            raw_audio, sr = waveform, sampling_rate
+        elif key[0] == "url":
+            raw_audio, sr = librosa.load(audio_content.audio_url, sr=self.audio_tokenizer.sampling_rate)
+        else:
+            raw_audio, sr = librosa.load(
+                BytesIO(base64.b64decode(audio_content.raw_audio)), 
+                sr=self.audio_tokenizer.sampling_rate
+            )
+        audio_ids = self.audio_tokenizer.encode(raw_audio, sr).squeeze(0).cpu()
+
+        if self.audio_ids_cache_size > 0:
+            self._audio_ids_cache[key] = audio_ids
+            while len(self._audio_ids_cache) > self.audio_ids_cache_size:
+                self._audio_ids_cache.popitem(last=False)
+        return audio_ids
+
     def _prepare_inputs(self, chat_ml_sample: ChatMLSample, force_audio_gen: bool = False):
         input_tokens, _, audio_contents, _ = prepare_chatml_sample(
             chat_ml_sample,
@@ -247,19 +297,9 @@ class HiggsAudioServeEngine:
         # Configure the audio inputs
         audio_ids_l = []
         for audio_content in audio_contents:
-            if audio_content.audio_url not in ["placeholder", ""]:
-                raw_audio, _ = librosa.load(audio_content.audio_url, sr=self.audio_tokenizer.sampling_rate)
-            elif audio_content.raw_audio is not None:
-                raw_audio, _ = librosa.load(
-                    BytesIO(base64.b64decode(audio_content.raw_audio)), 
-                    sr=self.audio_tokenizer.sampling_rate
-                )
-            else:
-                raw_audio = None
-
-            if raw_audio is not None:
-                audio_ids = self.audio_tokenizer.encode(raw_audio, self.audio_tokenizer.sampling_rate)
-                audio_ids_l.append(audio_ids.squeeze(0).cpu())
+            audio_ids = self._encode_audio_content(audio_content)
+            if audio_ids is not None:
+                audio_ids_l.append(audio_ids)
 
         if len(audio_ids_l) > 0:
             audio_ids_start = torch.tensor(
@@ -315,7 +355,7 @@ class HiggsAudioServeEngine:
         if ras_win_len is not None and ras_win_len <= 0:
             ras_win_len = None
 
-        with torch.no_grad():
+        with torch.inference_mode():
             t0 = time.time()
             inputs = self._prepare_inputs(chat_ml_sample, force_audio_gen=force_audio_gen)
             prompt_token_ids = inputs["input_ids"][0].cpu().numpy()
@@ -1,8 +1,17 @@
 import uvicorn
 
-from app.routes import create_app
-
-app = create_app()
-
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Project, cancel and saved-audio state live in the serving process, so this
+    # runs exactly one worker, and the app (and model) is only built inside it.
+    uvicorn.run(
+        "app.routes:create_app",
+        factory=True,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+    )
+else:
+    from app.routes import create_app
+    
+    app = create_app()
\ No newline at end of file